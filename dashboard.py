@@ -11,6 +11,7 @@ import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 # Page config
 st.set_page_config(
@@ -38,26 +39,75 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Load data
+DATA_DIR = Path("data/raw")
+DATASETS = ["brands", "influencers", "posts", "conversions", "touchpoints"]
+DATE_COLUMNS = {"posts": ["post_date"], "conversions": ["conversion_date"]}
+CATEGORY_COLUMNS = [
+    "platform", "tier", "content_type", "visual_style", "dominant_color",
+    "touchpoint_type", "attribution_type", "content_category"
+]
+DAY_NAMES = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+
+
+def _ensure_parquet(name):
+    """Convert a raw CSV to Parquet once, re-converting only when the CSV is newer."""
+    csv_path = DATA_DIR / f"{name}.csv"
+    parquet_path = DATA_DIR / f"{name}.parquet"
+    
+    if csv_path.exists() and (
+        not parquet_path.exists() or parquet_path.stat().st_mtime < csv_path.stat().st_mtime
+    ):
+        # Dates are written as ISO days; an explicit format skips per-row format inference
+        df = pd.read_csv(csv_path, parse_dates=DATE_COLUMNS.get(name, []), date_format="%Y-%m-%d")
+        df.to_parquet(parquet_path, index=False)
+    
+    return parquet_path
+
+
+def _read_dataset(name):
+    """Read one dataset, storing its low-cardinality string columns as categoricals."""
+    # Parquet keeps column types, so dates come back as timestamps without re-parsing;
+    # Arrow-backed dtypes keep strings compact and hand off to plotly without copies
+    df = pd.read_parquet(_ensure_parquet(name), dtype_backend="pyarrow")
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    if "day_of_week" in df.columns:
+        # Stored as 0 (Monday) .. 6; the codes stay the same, only the labels change
+        df["day_of_week"] = pd.Categorical.from_codes(
+            df["day_of_week"].to_numpy(dtype=np.int64), categories=DAY_NAMES, ordered=True
+        )
+    return df
+
+
+def posts_with_tier(posts, influencers):
+    return posts.merge(influencers[['influencer_id', 'tier', 'avg_collaboration_cost']], on='influencer_id')
+
+
+def enrich_posts(posts):
+    """Add total engagement (incl. shares) and engagement rate columns to posts in place."""
+    posts['total_engagement'] = posts['likes'] + posts['comments'] + posts['saves'] + posts['shares']
+    posts['engagement_rate'] = posts['total_engagement'] / posts['reach'] * 100
+    return posts
+
+
 @st.cache_data
 def load_data():
-    data_dir = Path("data/raw")
-    
-    if not data_dir.exists():
+    if not DATA_DIR.exists():
         st.error("⚠️ Data not found! Please run the data generation notebook first.")
         st.stop()
     
     try:
-        brands = pd.read_csv(data_dir / "brands.csv")
-        influencers = pd.read_csv(data_dir / "influencers.csv")
-        posts = pd.read_csv(data_dir / "posts.csv")
-        conversions = pd.read_csv(data_dir / "conversions.csv")
-        touchpoints = pd.read_csv(data_dir / "touchpoints.csv")
+        # The reads are independent and pyarrow releases the GIL, so run them side by side
+        with ThreadPoolExecutor(max_workers=len(DATASETS)) as executor:
+            brands, influencers, posts, conversions, touchpoints = executor.map(_read_dataset, DATASETS)
+        # Derived once per load, so no page has to rebuild or re-hash them
+        enrich_posts(posts)
+        posts_inf = posts_with_tier(posts, influencers)
         
-        # Parse dates
-        posts['post_date'] = pd.to_datetime(posts['post_date'])
-        conversions['conversion_date'] = pd.to_datetime(conversions['conversion_date'])
-        
-        return brands, influencers, posts, conversions, touchpoints
+        # Cheap stand-in for the frames in downstream cache keys; hashing them costs more than the aggregations
+        data_key = tuple((DATA_DIR / f"{name}.parquet").stat().st_mtime_ns for name in DATASETS)
+        return brands, influencers, posts, conversions, touchpoints, posts_inf, data_key
     except Exception as e:
         st.error(f"Error loading data: {e}")
         st.stop()
@@ -70,7 +120,130 @@ def load_scores():
         return pd.read_csv(scores_path)
     return None
 
-brands, influencers, posts, conversions, touchpoints = load_data()
+TIER_ORDER = ['nano', 'micro', 'mid', 'macro', 'mega']
+
+# Larger scatter selections are sampled per tier before being sent to the browser
+MAX_SCATTER_POINTS = 5000
+
+
+def show_chart(fig):
+    """Render a figure as-is; a fixed uirevision lets the browser keep its layout across reruns."""
+    fig.update_layout(uirevision='const')
+    st.plotly_chart(fig, use_container_width=True, theme=None)
+
+
+def top_k(df, column, k=10):
+    """Rows with the k largest values of column, like nlargest(k, column) but with an O(n) partition."""
+    values = df[column].to_numpy(dtype=float, na_value=np.nan)
+    positions = np.flatnonzero(~np.isnan(values))
+    if len(positions) > k:
+        cutoff = np.partition(values[positions], len(positions) - k)[len(positions) - k]
+        above = positions[values[positions] > cutoff]
+        # Ties at the cutoff keep their original order, as nlargest(keep='first') does
+        ties = positions[values[positions] == cutoff][:k - len(above)]
+        positions = np.concatenate([above, ties])
+    order = np.lexsort((positions, -values[positions]))
+    return df.iloc[positions[order]]
+
+
+# Cached aggregations (recomputed only when the underlying data changes). Frames are passed
+# with a leading underscore so Streamlit skips hashing them; data_key identifies the load instead.
+@st.cache_data
+def executive_kpis(_conversions, _brands, platform_metrics, data_key):
+    total_revenue = _conversions['order_value'].sum()
+    total_spend = _brands['monthly_social_budget'].sum() * 12
+    # Post totals are re-added from the per-platform sums instead of scanning posts again
+    totals = platform_metrics[['likes', 'comments', 'saves', 'reach']].sum()
+    total_engagement = totals['likes'] + totals['comments'] + totals['saves']
+    return {
+        'total_revenue': total_revenue,
+        'total_spend': total_spend,
+        'roi': (total_revenue - total_spend) / total_spend * 100,
+        'avg_engagement_rate': (total_engagement / totals['reach']) * 100
+    }
+
+
+@st.cache_data
+def compute_platform_metrics(_posts, data_key):
+    platform_metrics = _posts.groupby('platform', observed=True)[['likes', 'comments', 'saves', 'reach']].sum()
+    platform_metrics['engagement_rate'] = (
+        (platform_metrics['likes'] + platform_metrics['comments'] + platform_metrics['saves']) 
+        / platform_metrics['reach'] * 100
+    )
+    return platform_metrics
+
+
+@st.cache_data
+def compute_monthly_revenue(_conversions, data_key):
+    # Truncate to datetime64[M] in NumPy and group on that, then label the ~12 result rows
+    months = _conversions['conversion_date'].to_numpy().astype('datetime64[M]')
+    monthly_revenue = _conversions['order_value'].groupby(months).sum()
+    monthly_revenue.index = monthly_revenue.index.strftime('%Y-%m')
+    return monthly_revenue
+
+
+@st.cache_data
+def categorical_options(_influencers, data_key):
+    """Sidebar choices for the influencer filters; tiers follow TIER_ORDER."""
+    tiers = _influencers['tier'].cat.categories.tolist()
+    return {
+        'platform': sorted(_influencers['platform'].cat.categories.tolist()),
+        'tier': sorted(tiers, key=lambda t: TIER_ORDER.index(t) if t in TIER_ORDER else len(TIER_ORDER)),
+    }
+
+
+@st.cache_data
+def compute_tier_metrics(_posts_inf, data_key):
+    tier_metrics = (
+        _posts_inf.groupby('tier', observed=True, sort=False)[
+            ['likes', 'comments', 'saves', 'reach', 'avg_collaboration_cost']
+        ]
+        .mean()
+        .reindex(TIER_ORDER)
+    )
+    tier_metrics['engagement_rate'] = (
+        (tier_metrics['likes'] + tier_metrics['comments'] + tier_metrics['saves']) / tier_metrics['reach'] * 100
+    )
+    return tier_metrics
+
+
+@st.cache_data
+def compute_engagement_by(_posts, column, data_key):
+    # Callers sort by value, so skip the key sort
+    return _posts.groupby(column, observed=True, sort=False)['engagement_rate'].mean()
+
+
+@st.cache_data
+def compute_heatmap(_posts, data_key):
+    day_names = _posts['day_of_week'].cat.categories.to_numpy()
+    rates = _posts['engagement_rate'].to_numpy(dtype=float, na_value=np.nan)
+    valid = ~np.isnan(rates)
+    
+    # Mean per (day, hour) cell from two bincounts over a flat 7 x 24 grid
+    days = _posts['day_of_week'].cat.codes.to_numpy(dtype=np.int64)[valid]
+    hours = _posts['post_time_hour'].to_numpy(dtype=np.int64)[valid]
+    cells = days * 24 + hours
+    sums = np.bincount(cells, weights=rates[valid], minlength=7 * 24).reshape(7, 24)
+    counts = np.bincount(cells, minlength=7 * 24).reshape(7, 24)
+    with np.errstate(invalid='ignore'):
+        means = sums / counts
+    
+    # Only keep days and hours that have posts
+    days_seen, hours_seen = counts.any(axis=1), counts.any(axis=0)
+    return pd.DataFrame(
+        means[np.ix_(days_seen, hours_seen)],
+        index=day_names[days_seen],
+        columns=np.flatnonzero(hours_seen)
+    )
+
+
+@st.cache_data
+def compute_converting_touchpoints(_touchpoints, data_key):
+    converting_tp = _touchpoints[_touchpoints['contributed_to_conversion'] == True]
+    return converting_tp['touchpoint_type'].value_counts(), converting_tp['platform'].value_counts()
+
+
+brands, influencers, posts, conversions, touchpoints, posts_inf, data_key = load_data()
 influencer_scores = load_scores()
 
 # Sidebar
@@ -91,23 +264,20 @@ if page == "📈 Executive Summary":
     st.markdown("### Executive Summary")
     
     # Calculate metrics
-    total_revenue = conversions['order_value'].sum()
-    total_spend = brands['monthly_social_budget'].sum() * 12
-    roi = (total_revenue - total_spend) / total_spend * 100
-    total_engagement = posts['likes'].sum() + posts['comments'].sum() + posts['saves'].sum()
-    avg_engagement_rate = (total_engagement / posts['reach'].sum()) * 100
+    platform_metrics = compute_platform_metrics(posts, data_key)
+    kpis = executive_kpis(conversions, brands, platform_metrics, data_key)
     
     # KPI Cards
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("💰 Total Revenue", f"${total_revenue:,.0f}")
+        st.metric("💰 Total Revenue", f"${kpis['total_revenue']:,.0f}")
     with col2:
-        st.metric("💸 Marketing Spend", f"${total_spend:,.0f}")
+        st.metric("💸 Marketing Spend", f"${kpis['total_spend']:,.0f}")
     with col3:
-        st.metric("📊 Overall ROI", f"{roi:.1f}%", delta=f"{roi:.1f}%")
+        st.metric("📊 Overall ROI", f"{kpis['roi']:.1f}%", delta=f"{kpis['roi']:.1f}%")
     with col4:
-        st.metric("💫 Avg Engagement Rate", f"{avg_engagement_rate:.2f}%")
+        st.metric("💫 Avg Engagement Rate", f"{kpis['avg_engagement_rate']:.2f}%")
     
     st.divider()
     
@@ -116,27 +286,21 @@ if page == "📈 Executive Summary":
     
     with col1:
         st.subheader("Platform Performance")
-        platform_metrics = posts.groupby('platform').agg({
-            'likes': 'sum', 'comments': 'sum', 'saves': 'sum', 'reach': 'sum'
-        })
-        platform_metrics['engagement_rate'] = (
-            (platform_metrics['likes'] + platform_metrics['comments'] + platform_metrics['saves']) 
-            / platform_metrics['reach'] * 100
+        fig = go.Figure(go.Bar(
+            x=platform_metrics.index.astype(str),
+            y=platform_metrics['engagement_rate'],
+            marker_color=px.colors.qualitative.Plotly[:len(platform_metrics)]
+        ))
+        fig.update_layout(
+            title="Engagement Rate by Platform",
+            xaxis_title='Platform',
+            yaxis_title='Engagement Rate (%)'
         )
-        
-        fig = px.bar(
-            platform_metrics.reset_index(), 
-            x='platform', 
-            y='engagement_rate',
-            color='platform',
-            title="Engagement Rate by Platform"
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
     
     with col2:
         st.subheader("Revenue Over Time")
-        monthly_revenue = conversions.groupby(conversions['conversion_date'].dt.to_period('M'))['order_value'].sum()
-        monthly_revenue.index = monthly_revenue.index.astype(str)
+        monthly_revenue = compute_monthly_revenue(conversions, data_key)
         
         fig = px.line(
             x=monthly_revenue.index, 
@@ -145,29 +309,23 @@ if page == "📈 Executive Summary":
             labels={'x': 'Month', 'y': 'Revenue ($)'}
         )
         fig.update_traces(line_color='#667eea', line_width=3)
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
     
     # Tier performance
     st.subheader("Influencer Tier Performance")
-    posts_inf = posts.merge(influencers[['influencer_id', 'tier', 'avg_collaboration_cost']], on='influencer_id')
-    tier_order = ['nano', 'micro', 'mid', 'macro', 'mega']
-    
-    tier_metrics = posts_inf.groupby('tier').agg({
-        'likes': 'mean', 'comments': 'mean', 'saves': 'mean', 'reach': 'mean'
-    }).reindex(tier_order)
-    tier_metrics['engagement_rate'] = (
-        (tier_metrics['likes'] + tier_metrics['comments'] + tier_metrics['saves']) / tier_metrics['reach'] * 100
-    )
-    
-    fig = px.bar(
-        tier_metrics.reset_index(),
-        x='tier',
-        y='engagement_rate',
-        color='tier',
+    tier_metrics = compute_tier_metrics(posts_inf, data_key)
+    
+    fig = go.Figure(go.Bar(
+        x=tier_metrics.index.astype(str),
+        y=tier_metrics['engagement_rate'],
+        marker_color=px.colors.sequential.RdBu[:len(tier_metrics)]
+    ))
+    fig.update_layout(
         title="Engagement Rate by Influencer Tier",
-        color_discrete_sequence=px.colors.sequential.RdBu
+        xaxis_title='Tier',
+        yaxis_title='Engagement Rate (%)'
     )
-    st.plotly_chart(fig, use_container_width=True)
+    show_chart(fig)
 
 # =============================================
 # INFLUENCER ANALYSIS
@@ -176,27 +334,35 @@ elif page == "👤 Influencer Analysis":
     st.title("👤 Influencer Performance Analysis")
     
     # Filters
+    options = categorical_options(influencers, data_key)
     col1, col2, col3 = st.columns(3)
     with col1:
-        selected_platform = st.selectbox("Platform", ["All"] + list(influencers['platform'].unique()))
+        selected_platform = st.selectbox("Platform", ["All"] + options['platform'])
     with col2:
-        selected_tier = st.selectbox("Tier", ["All"] + list(influencers['tier'].unique()))
+        selected_tier = st.selectbox("Tier", ["All"] + options['tier'])
     with col3:
         min_followers = st.slider("Min Followers", 0, 1000000, 0, step=10000)
     
     # Filter data
-    filtered_inf = influencers.copy()
+    mask = influencers['follower_count'] >= min_followers
     if selected_platform != "All":
-        filtered_inf = filtered_inf[filtered_inf['platform'] == selected_platform]
+        mask &= influencers['platform'] == selected_platform
     if selected_tier != "All":
-        filtered_inf = filtered_inf[filtered_inf['tier'] == selected_tier]
-    filtered_inf = filtered_inf[filtered_inf['follower_count'] >= min_followers]
+        mask &= influencers['tier'] == selected_tier
+    filtered_inf = influencers.loc[mask]
     
     st.metric("Influencers Shown", f"{len(filtered_inf):,}")
     
     # Scatter plot
+    scatter_inf = filtered_inf
+    if len(filtered_inf) > MAX_SCATTER_POINTS:
+        scatter_inf = filtered_inf.groupby('tier', observed=True, group_keys=False).sample(
+            frac=MAX_SCATTER_POINTS / len(filtered_inf), random_state=42
+        )
+        st.caption(f"Plotting a {len(scatter_inf):,}-point sample stratified by tier")
+    
     fig = px.scatter(
-        filtered_inf,
+        scatter_inf,
         x='follower_count',
         y='engagement_rate',
         color='tier',
@@ -206,11 +372,12 @@ elif page == "👤 Influencer Analysis":
         labels={'follower_count': 'Followers', 'engagement_rate': 'Engagement Rate (%)'}
     )
     fig.update_layout(xaxis_type="log")
-    st.plotly_chart(fig, use_container_width=True)
+    fig.update_traces(marker=dict(line=dict(width=0)))
+    show_chart(fig)
     
     # Top influencers table
     st.subheader("Top Influencers by Engagement")
-    top_inf = filtered_inf.nlargest(10, 'engagement_rate')[
+    top_inf = top_k(filtered_inf, 'engagement_rate', 10)[
         ['username', 'platform', 'tier', 'follower_count', 'engagement_rate', 'avg_collaboration_cost']
     ]
     st.dataframe(top_inf, use_container_width=True)
@@ -233,7 +400,7 @@ elif page == "👤 Influencer Analysis":
                     nbins=30,
                     title="Score Distribution"
                 )
-                st.plotly_chart(fig, use_container_width=True)
+                show_chart(fig)
             
             with col2:
                 # Segment counts
@@ -244,7 +411,7 @@ elif page == "👤 Influencer Analysis":
                     title="Performance Segments",
                     color_discrete_sequence=['green', 'orange', 'red']
                 )
-                st.plotly_chart(fig, use_container_width=True)
+                show_chart(fig)
 
 # =============================================
 # CONTENT PERFORMANCE
@@ -252,60 +419,60 @@ elif page == "👤 Influencer Analysis":
 elif page == "📱 Content Performance":
     st.title("📱 Content Performance Analysis")
     
-    # Add engagement metrics
-    posts['total_engagement'] = posts['likes'] + posts['comments'] + posts['saves'] + posts['shares']
-    posts['engagement_rate'] = posts['total_engagement'] / posts['reach'] * 100
-    
     col1, col2 = st.columns(2)
     
     with col1:
         st.subheader("Content Type Performance")
-        content_metrics = posts.groupby('content_type')['engagement_rate'].mean().sort_values(ascending=True)
-        fig = px.bar(
-            x=content_metrics.values,
-            y=content_metrics.index,
-            orientation='h',
+        content_metrics = compute_engagement_by(posts, 'content_type', data_key).sort_values(ascending=True)
+        fig = go.Figure(go.Bar(x=content_metrics.values, y=content_metrics.index.astype(str), orientation='h'))
+        fig.update_layout(
             title="Engagement Rate by Content Type",
-            labels={'x': 'Engagement Rate (%)', 'y': 'Content Type'}
+            xaxis_title='Engagement Rate (%)',
+            yaxis_title='Content Type'
         )
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
     
     with col2:
         st.subheader("Visual Style Performance")
-        style_metrics = posts.groupby('visual_style')['engagement_rate'].mean().sort_values(ascending=True)
-        fig = px.bar(
-            x=style_metrics.values,
-            y=style_metrics.index,
-            orientation='h',
+        style_metrics = compute_engagement_by(posts, 'visual_style', data_key).sort_values(ascending=True)
+        fig = go.Figure(go.Bar(x=style_metrics.values, y=style_metrics.index.astype(str), orientation='h'))
+        fig.update_layout(
             title="Engagement Rate by Visual Style",
-            labels={'x': 'Engagement Rate (%)', 'y': 'Visual Style'}
+            xaxis_title='Engagement Rate (%)',
+            yaxis_title='Visual Style'
         )
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
     
     # Posting time heatmap
     st.subheader("📅 Optimal Posting Times")
-    day_names = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-    heatmap_data = posts.groupby(['day_of_week', 'post_time_hour'])['engagement_rate'].mean().unstack()
-    heatmap_data.index = [day_names[i] for i in heatmap_data.index]
-    
-    fig = px.imshow(
-        heatmap_data,
-        labels=dict(x="Hour of Day", y="Day of Week", color="Engagement Rate (%)"),
+    heatmap_data = compute_heatmap(posts, data_key)
+    
+    fig = go.Figure(go.Heatmap(
+        z=heatmap_data.to_numpy(),
+        x=heatmap_data.columns,
+        y=heatmap_data.index,
+        colorscale="RdYlGn",
+        colorbar=dict(title="Engagement Rate (%)"),
+        hovertemplate="%{y} %{x}:00<br>Engagement Rate: %{z:.2f}%<extra></extra>"
+    ))
+    fig.update_layout(
         title="Engagement Rate by Day & Time",
-        color_continuous_scale="RdYlGn"
+        xaxis_title="Hour of Day",
+        yaxis_title="Day of Week",
+        yaxis_autorange="reversed"
     )
-    st.plotly_chart(fig, use_container_width=True)
+    show_chart(fig)
     
     # Color analysis
     st.subheader("🎨 Color Performance")
-    color_metrics = posts.groupby('dominant_color')['engagement_rate'].mean().sort_values(ascending=False)
-    fig = px.bar(
-        x=color_metrics.index,
-        y=color_metrics.values,
+    color_metrics = compute_engagement_by(posts, 'dominant_color', data_key).sort_values(ascending=False)
+    fig = go.Figure(go.Bar(x=color_metrics.index.astype(str), y=color_metrics.values))
+    fig.update_layout(
         title="Engagement Rate by Dominant Color",
-        labels={'x': 'Color', 'y': 'Engagement Rate (%)'}
+        xaxis_title='Color',
+        yaxis_title='Engagement Rate (%)'
     )
-    st.plotly_chart(fig, use_container_width=True)
+    show_chart(fig)
 
 # =============================================
 # ATTRIBUTION ANALYSIS
@@ -316,29 +483,27 @@ elif page == "🎯 Attribution Analysis":
     # Touchpoint analysis
     st.subheader("Customer Journey Touchpoints")
     
-    converting_tp = touchpoints[touchpoints['contributed_to_conversion'] == True]
+    tp_counts, platform_counts = compute_converting_touchpoints(touchpoints, data_key)
     
     col1, col2 = st.columns(2)
     
     with col1:
         # Touchpoint type distribution
-        tp_counts = converting_tp['touchpoint_type'].value_counts()
         fig = px.pie(
             values=tp_counts.values,
             names=tp_counts.index,
             title="Touchpoint Types in Converting Journeys"
         )
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
     
     with col2:
         # Platform distribution
-        platform_counts = converting_tp['platform'].value_counts()
         fig = px.pie(
             values=platform_counts.values,
             names=platform_counts.index,
             title="Platforms in Converting Journeys"
         )
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
     
     # Journey length analysis
     st.subheader("Customer Journey Length")
@@ -352,18 +517,18 @@ elif page == "🎯 Attribution Analysis":
     )
     fig.add_vline(x=journey_lengths.mean(), line_dash="dash", line_color="red", 
                   annotation_text=f"Mean: {journey_lengths.mean():.1f} days")
-    st.plotly_chart(fig, use_container_width=True)
+    show_chart(fig)
     
     # Attribution type distribution
     st.subheader("Attribution Model Usage")
     attr_dist = conversions['attribution_type'].value_counts()
-    fig = px.bar(
-        x=attr_dist.index,
-        y=attr_dist.values,
+    fig = go.Figure(go.Bar(x=attr_dist.index.astype(str), y=attr_dist.values))
+    fig.update_layout(
         title="Attribution Model Distribution",
-        labels={'x': 'Attribution Type', 'y': 'Count'}
+        xaxis_title='Attribution Type',
+        yaxis_title='Count'
     )
-    st.plotly_chart(fig, use_container_width=True)
+    show_chart(fig)
 
 # =============================================
 # ROI CALCULATOR
@@ -414,34 +579,22 @@ elif page == "💰 ROI Calculator":
     # Estimated results based on historical performance
     st.subheader("📈 Estimated Results")
     
-    # Get historical performance by tier
-    posts_inf = posts.merge(influencers[['influencer_id', 'tier', 'avg_collaboration_cost']], on='influencer_id')
-    
     tier_map = {'nano': 'Nano', 'micro': 'Micro', 'mid': 'Mid', 'macro': 'Macro', 'mega': 'Mega'}
     
-    # Calculate estimated metrics
-    results = []
-    for tier_lower, tier_nice in tier_map.items():
-        tier_data = posts_inf[posts_inf['tier'] == tier_lower]
-        if len(tier_data) > 0:
-            avg_cost = tier_data['avg_collaboration_cost'].mean()
-            avg_reach = tier_data['reach'].mean()
-            avg_engagement = (tier_data['likes'] + tier_data['comments'] + tier_data['saves']).mean()
-            
-            budget = allocations[tier_nice]
-            estimated_posts = budget / avg_cost if avg_cost > 0 else 0
-            estimated_reach = estimated_posts * avg_reach
-            estimated_engagement = estimated_posts * avg_engagement
-            
-            results.append({
-                'Tier': tier_nice,
-                'Budget': budget,
-                'Est. Posts': int(estimated_posts),
-                'Est. Reach': int(estimated_reach),
-                'Est. Engagement': int(estimated_engagement)
-            })
-    
-    results_df = pd.DataFrame(results)
+    # Calculate estimated metrics for every tier at once
+    tier_stats = compute_tier_metrics(posts_inf, data_key).dropna(subset=['reach'])
+    budgets = np.array([allocations[tier_map[tier]] for tier in tier_stats.index], dtype=float)
+    avg_cost = tier_stats['avg_collaboration_cost'].to_numpy(dtype=float)
+    avg_engagement = (tier_stats['likes'] + tier_stats['comments'] + tier_stats['saves']).to_numpy(dtype=float)
+    
+    estimated_posts = np.divide(budgets, avg_cost, out=np.zeros_like(budgets), where=avg_cost > 0)
+    results_df = pd.DataFrame({
+        'Tier': [tier_map[tier] for tier in tier_stats.index],
+        'Budget': budgets,
+        'Est. Posts': estimated_posts.astype(int),
+        'Est. Reach': (estimated_posts * tier_stats['reach'].to_numpy(dtype=float)).astype(int),
+        'Est. Engagement': (estimated_posts * avg_engagement).astype(int)
+    })
     st.dataframe(results_df, use_container_width=True)
     
     # Total estimates
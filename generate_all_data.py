@@ -4,13 +4,15 @@ Equivalent to running all notebooks in sequence.
 """
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-from uuid import uuid4
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import warnings
 warnings.filterwarnings('ignore')
 
-np.random.seed(42)
+rng = np.random.default_rng(42)
 print("=" * 60)
 print("📊 SOCIAL MEDIA ROI ATTRIBUTION - DATA GENERATION")
 print("=" * 60)
@@ -41,202 +43,255 @@ SEASONALITY = {1: 0.85, 2: 0.90, 3: 0.95, 4: 1.00, 5: 0.95, 6: 0.85, 7: 0.80, 8:
 COLORS = ["neutral_beige", "cream_white", "classic_black", "navy_blue", "olive_green", "terracotta", "dusty_rose", "burgundy", "camel_brown", "sage_green"]
 CONTENT_TYPES = {"Instagram": {"photo": 0.35, "carousel": 0.25, "reel": 0.30, "story": 0.10}, "TikTok": {"video": 0.95, "photo": 0.05}, "YouTube": {"video": 0.85, "shorts": 0.15}, "Twitter": {"photo": 0.50, "video": 0.25, "text": 0.25}}
 
+def dist_arrays(dist):
+    return np.array(list(dist.keys())), np.array(list(dist.values()))
+
 def sample_dist(dist, n=1):
-    return np.random.choice(list(dist.keys()), size=n, p=list(dist.values()))
+    keys, probs = dist
+    return rng.choice(keys, size=n, p=probs)
+
+PLATFORMS = dist_arrays(PLATFORM_DIST)
+COUNTRIES = dist_arrays(COUNTRY_DIST)
+GENDERS = dist_arrays(GENDER_DIST)
+AGES = dist_arrays(AGE_DIST)
+VISUALS = dist_arrays(VISUAL_STYLES)
+PLATFORM_CONTENT_TYPES = {platform: dist_arrays(types) for platform, types in CONTENT_TYPES.items()}
+TOUCHPOINT_TYPES = dist_arrays({"view": 0.35, "click": 0.20, "save": 0.10, "like": 0.15, "comment": 0.05, "website_visit": 0.10, "add_to_cart": 0.05})
+
+CATEGORY_COLUMNS = ["platform", "tier", "country", "content_category", "gender", "age_group", "brand_tier", "primary_platform",
+                    "target_demographic", "content_type", "visual_style", "dominant_color", "attribution_type",
+                    "utm_source", "utm_medium", "product_category", "touchpoint_type"]
+
+def categorize(df):
+    return df.astype({column: "category" for column in CATEGORY_COLUMNS if column in df})
+
+def write_csv(df, path):
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
+
+def write_parquet(df, path, batch_rows=10000):
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    with pq.ParquetWriter(path, table.schema, compression="snappy") as parquet_writer:
+        for batch in table.to_batches(max_chunksize=batch_rows):
+            parquet_writer.write_batch(batch)
+
+def write_csv_and_parquet(df, name, **typed_columns):
+    write_csv(df, data_dir / f"{name}.csv")
+    # Written after the CSV so its mtime marks it as current for the dashboard's Parquet cache
+    write_parquet(df.assign(**typed_columns), data_dir / f"{name}.parquet")
+
+def batch_uuids(n):
+    raw = np.frombuffer(rng.bytes(16 * n), dtype=np.uint8).reshape(n, 16).copy()
+    raw[:, 6] = raw[:, 6] & 0x0F | 0x40
+    raw[:, 8] = raw[:, 8] & 0x3F | 0x80
+    h = raw.tobytes().hex()
+    return [f"{h[i:i+8]}-{h[i+8:i+12]}-{h[i+12:i+16]}-{h[i+16:i+20]}-{h[i+20:i+32]}" for i in range(0, 32 * n, 32)]
+
+TIER_NAMES, TIER_PROBS = dist_arrays(TIER_DIST)
+BRAND_TIER_NAMES, BRAND_TIER_PROBS = dist_arrays(BRAND_TIERS)
+
+def tier_params(params, tier_idx, names=TIER_NAMES):
+    table = np.array([params[tier] for tier in names], dtype=float)
+    return table[tier_idx, 0], table[tier_idx, 1]
+
+SEASON_ARR = np.array([0.0] + [SEASONALITY[month] for month in range(1, 13)])
+TIER_LOG_FOLLOWERS = np.log(np.array([TIER_FOLLOWERS[tier] for tier in TIER_NAMES], dtype=float))
 
-def gen_followers(tier):
-    low, high = TIER_FOLLOWERS[tier]
-    return int(np.exp(np.random.uniform(np.log(low), np.log(high))))
+def gen_followers(tier_idx):
+    log_low, log_high = TIER_LOG_FOLLOWERS[tier_idx].T
+    return np.exp(rng.uniform(log_low, log_high)).astype(int)
 
-def gen_engagement(tier):
-    mean, std = TIER_ENGAGEMENT[tier]
-    return np.clip(np.random.normal(mean, std), 0.5, 12.0)
+def gen_engagement(tier_idx):
+    mean, std = tier_params(TIER_ENGAGEMENT, tier_idx)
+    return np.clip(rng.normal(mean, std), 0.5, 12.0)
 
-def gen_authenticity(tier):
-    mean, std = TIER_AUTHENTICITY[tier]
-    return np.clip(np.random.normal(mean, std), 0.4, 0.99)
+def gen_authenticity(tier_idx):
+    mean, std = tier_params(TIER_AUTHENTICITY, tier_idx)
+    return np.clip(rng.normal(mean, std), 0.4, 0.99)
 
-def gen_cost(tier, followers):
-    low, high = TIER_COST[tier]
-    tier_range = TIER_FOLLOWERS[tier]
-    position = (followers - tier_range[0]) / (tier_range[1] - tier_range[0])
-    return round((low + position * (high - low)) * np.random.uniform(0.8, 1.2), 2)
+def gen_cost(tier_idx, followers):
+    low, high = tier_params(TIER_COST, tier_idx)
+    range_low, range_high = tier_params(TIER_FOLLOWERS, tier_idx)
+    position = (followers - range_low) / (range_high - range_low)
+    return np.round((low + position * (high - low)) * rng.uniform(0.8, 1.2, len(tier_idx)), 2)
 
-def gen_engagement_metrics(followers, eng_rate, is_viral=False):
-    variance = np.random.uniform(0.7, 1.3) * (np.random.uniform(3, 10) if is_viral else 1)
-    total = int(followers * (eng_rate / 100) * variance)
-    likes = max(1, int(total * np.random.uniform(0.85, 0.92)))
-    comments = max(0, int(likes * np.random.uniform(0.03, 0.08)))
-    shares = max(0, int(likes * np.random.uniform(0.01, 0.025)))
-    saves = max(0, int(likes * np.random.uniform(0.02, 0.05)))
+def gen_engagement_metrics(followers, eng_rate, is_viral):
+    n = len(followers)
+    total = rng.uniform(0.7, 1.3, n)
+    total[is_viral] *= rng.uniform(3, 10, np.count_nonzero(is_viral))
+    total *= followers
+    total *= eng_rate
+    total /= 100
+    np.floor(total, out=total)
+    total *= rng.uniform(0.85, 0.92, n)
+    likes = np.maximum(total.astype(np.int64), 1)
+    ratios = rng.uniform([0.03, 0.01, 0.02], [0.08, 0.025, 0.05], (n, 3))
+    ratios *= likes[:, None]
+    comments, shares, saves = ratios.astype(np.int64).T
     return likes, comments, shares, saves
 
-def gen_order_value(brand_tier):
-    low, high = BRAND_AOV[brand_tier]
-    value = np.exp(np.random.normal((np.log(low) + np.log(high)) / 2, (np.log(high) - np.log(low)) / 4))
-    return round(np.clip(value, low * 0.5, high * 1.5), 2)
+def gen_order_value(brand_tier_idx):
+    low, high = tier_params(BRAND_AOV, brand_tier_idx, BRAND_TIER_NAMES)
+    value = np.exp(rng.normal((np.log(low) + np.log(high)) / 2, (np.log(high) - np.log(low)) / 4))
+    return np.round(np.clip(value, low * 0.5, high * 1.5), 2)
 
 # Create directories
 data_dir = Path("data/raw")
 data_dir.mkdir(parents=True, exist_ok=True)
 Path("data/processed").mkdir(parents=True, exist_ok=True)
+writer = ThreadPoolExecutor(max_workers=2)
+pending_writes = []
 
 # Generate Brands
 print("\n🏢 Generating Brands...")
 brand_prefixes = ["Maison", "Atelier", "Casa", "Studio", "House of", "La", "Le", "The", "Modern", "Luxe"]
 brand_suffixes = ["Mode", "Style", "Vogue", "Chic", "Edit", "Label", "Collective", "Co", "Design", "Wear"]
-brands = []
-tiers = sample_dist(BRAND_TIERS, N_BRANDS)
-for i in range(N_BRANDS):
-    tier = tiers[i]
-    budget_ranges = {"Luxury": (200000, 500000), "Premium": (100000, 250000), "Mid-market": (50000, 150000), "Fast-fashion": (75000, 200000), "DTC": (25000, 100000)}
-    low, high = budget_ranges[tier]
-    brands.append({
-        "brand_id": str(uuid4()), "brand_name": f"{np.random.choice(brand_prefixes)} {np.random.choice(brand_suffixes)}",
-        "brand_tier": tier, "monthly_social_budget": round(np.random.uniform(low, high), 2),
-        "primary_platform": sample_dist(PLATFORM_DIST)[0], "avg_product_price": gen_order_value(tier),
-        "target_demographic": np.random.choice(["18-24", "25-34", "35-44", "25-44"]), "founded_year": np.random.randint(1990, 2022)
-    })
-brands_df = pd.DataFrame(brands)
+budget_ranges = {"Luxury": (200000, 500000), "Premium": (100000, 250000), "Mid-market": (50000, 150000), "Fast-fashion": (75000, 200000), "DTC": (25000, 100000)}
+brand_tier_idx = rng.choice(len(BRAND_TIER_NAMES), size=N_BRANDS, p=BRAND_TIER_PROBS)
+budget_low, budget_high = tier_params(budget_ranges, brand_tier_idx, BRAND_TIER_NAMES)
+brands_df = categorize(pd.DataFrame({
+    "brand_id": batch_uuids(N_BRANDS),
+    "brand_name": [f"{prefix} {suffix}" for prefix, suffix in zip(rng.choice(brand_prefixes, N_BRANDS), rng.choice(brand_suffixes, N_BRANDS))],
+    "brand_tier": BRAND_TIER_NAMES[brand_tier_idx], "monthly_social_budget": np.round(rng.uniform(budget_low, budget_high), 2),
+    "primary_platform": sample_dist(PLATFORMS, N_BRANDS), "avg_product_price": gen_order_value(brand_tier_idx),
+    "target_demographic": rng.choice(["18-24", "25-34", "35-44", "25-44"], N_BRANDS), "founded_year": rng.integers(1990, 2022, N_BRANDS)
+}))
+pending_writes.append(writer.submit(write_csv_and_parquet, brands_df, "brands"))
 print(f"   ✅ {len(brands_df)} brands")
 
 # Generate Influencers
 print("👤 Generating Influencers...")
-influencers = []
-tiers = sample_dist(TIER_DIST, N_INFLUENCERS)
-platforms = sample_dist(PLATFORM_DIST, N_INFLUENCERS)
-countries = sample_dist(COUNTRY_DIST, N_INFLUENCERS)
-genders = sample_dist(GENDER_DIST, N_INFLUENCERS)
-ages = sample_dist(AGE_DIST, N_INFLUENCERS)
-for i in range(N_INFLUENCERS):
-    tier = tiers[i]
-    followers = gen_followers(tier)
-    influencers.append({
-        "influencer_id": str(uuid4()), "username": f"creator_{i+1:05d}", "platform": platforms[i],
-        "tier": tier, "follower_count": followers, "engagement_rate": round(gen_engagement(tier), 2),
-        "country": countries[i], "content_category": np.random.choice(CONTENT_CATEGORIES),
-        "avg_post_frequency": round(np.clip(np.random.normal(4.2, 1.5), 1, 10), 1),
-        "audience_authenticity_score": round(gen_authenticity(tier), 2),
-        "avg_collaboration_cost": gen_cost(tier, followers), "account_age_months": np.random.randint(12, 96),
-        "gender": genders[i], "age_group": ages[i],
-        "verified": np.random.random() < (0.1 if tier in ["nano", "micro"] else 0.5), "active": np.random.random() < 0.95
-    })
-influencers_df = pd.DataFrame(influencers)
+tier_idx = rng.choice(len(TIER_NAMES), size=N_INFLUENCERS, p=TIER_PROBS)
+tiers = TIER_NAMES[tier_idx]
+platforms = sample_dist(PLATFORMS, N_INFLUENCERS)
+countries = sample_dist(COUNTRIES, N_INFLUENCERS)
+genders = sample_dist(GENDERS, N_INFLUENCERS)
+ages = sample_dist(AGES, N_INFLUENCERS)
+followers = gen_followers(tier_idx)
+influencers_df = categorize(pd.DataFrame({
+    "influencer_id": batch_uuids(N_INFLUENCERS),
+    "username": [f"creator_{i+1:05d}" for i in range(N_INFLUENCERS)], "platform": platforms,
+    "tier": tiers, "follower_count": followers, "engagement_rate": np.round(gen_engagement(tier_idx), 2),
+    "country": countries, "content_category": rng.choice(CONTENT_CATEGORIES, N_INFLUENCERS),
+    "avg_post_frequency": np.round(np.clip(rng.normal(4.2, 1.5, N_INFLUENCERS), 1, 10), 1),
+    "audience_authenticity_score": np.round(gen_authenticity(tier_idx), 2),
+    "avg_collaboration_cost": gen_cost(tier_idx, followers),
+    "account_age_months": rng.integers(12, 96, N_INFLUENCERS),
+    "gender": genders, "age_group": ages,
+    "verified": rng.random(N_INFLUENCERS) < np.where(np.isin(tiers, ["nano", "micro"]), 0.1, 0.5),
+    "active": rng.random(N_INFLUENCERS) < 0.95
+}))
+pending_writes.append(writer.submit(write_csv, influencers_df, data_dir / "influencers.csv"))
 print(f"   ✅ {len(influencers_df)} influencers")
 
 # Generate Posts
 print("📱 Generating Posts...")
-start_date = datetime.strptime(DATE_START, "%Y-%m-%d")
-end_date = datetime.strptime(DATE_END, "%Y-%m-%d")
-date_range = (end_date - start_date).days
-inf_ids = influencers_df["influencer_id"].tolist()
-brand_ids = brands_df["brand_id"].tolist()
-inf_lookup = influencers_df.set_index("influencer_id").to_dict("index")
-posts = []
-for i in range(N_POSTS):
-    inf_id = np.random.choice(inf_ids)
-    inf = inf_lookup[inf_id]
-    platform = inf["platform"]
-    post_date = start_date + timedelta(days=np.random.randint(0, date_range))
-    month = post_date.month
-    content_types = CONTENT_TYPES.get(platform, {"photo": 1.0})
-    content_type = sample_dist(content_types)[0]
-    is_sponsored = np.random.random() < (0.25 if inf["tier"] in ["mid", "macro", "mega"] else 0.10)
-    is_viral = np.random.random() < 0.05
-    eng_rate = inf["engagement_rate"] * SEASONALITY[month]
-    likes, comments, shares, saves = gen_engagement_metrics(inf["follower_count"], eng_rate, is_viral)
-    reach = int(inf["follower_count"] * np.random.uniform(0.20, 0.40))
-    posts.append({
-        "post_id": str(uuid4()), "influencer_id": inf_id, "brand_id": np.random.choice(brand_ids) if is_sponsored else None,
-        "platform": platform, "post_date": post_date.strftime("%Y-%m-%d"),
-        "post_time_hour": np.random.randint(6, 24),
-        "day_of_week": np.random.choice(range(7), p=[0.12, 0.16, 0.17, 0.16, 0.14, 0.13, 0.12]),
-        "content_type": content_type, "caption_length": int(np.clip(np.random.normal(180, 80), 20, 500)),
-        "hashtag_count": int(np.clip(np.random.normal(8 if platform == "Instagram" else 4, 3), 1, 30)),
-        "has_cta": np.random.random() < 0.45, "product_count": np.random.poisson(2) if is_sponsored else 0,
-        "visual_style": sample_dist(VISUAL_STYLES)[0], "dominant_color": np.random.choice(COLORS),
-        "is_sponsored": is_sponsored, "discount_code_present": is_sponsored and np.random.random() < 0.30,
-        "likes": likes, "comments": comments, "shares": shares, "saves": saves,
-        "reach": reach, "impressions": int(reach * np.random.uniform(1.2, 1.8))
-    })
-    if (i + 1) % 10000 == 0:
-        print(f"   ... {i+1:,} posts")
-posts_df = pd.DataFrame(posts)
+start_date, end_date = np.datetime64(DATE_START), np.datetime64(DATE_END)
+date_range = (end_date - start_date).astype(int)
+brand_ids = brands_df["brand_id"].to_numpy()
+inf_ids = influencers_df["influencer_id"].to_numpy()
+inf_platform = influencers_df["platform"].to_numpy()
+inf_tier = influencers_df["tier"].to_numpy()
+inf_followers = influencers_df["follower_count"].to_numpy()
+inf_engagement = influencers_df["engagement_rate"].to_numpy()
+inf_idx = rng.integers(0, N_INFLUENCERS, N_POSTS)
+platforms = inf_platform[inf_idx]
+followers = inf_followers[inf_idx]
+post_brand_idx = rng.integers(0, N_BRANDS, N_POSTS)
+post_dates = start_date + rng.integers(0, date_range, N_POSTS).astype("timedelta64[D]")
+months = post_dates.astype("datetime64[M]").astype(int) % 12 + 1
+content_types = np.full(N_POSTS, "photo", dtype=object)
+for platform, types in PLATFORM_CONTENT_TYPES.items():
+    on_platform = platforms == platform
+    content_types[on_platform] = sample_dist(types, on_platform.sum())
+is_sponsored = rng.random(N_POSTS) < np.where(np.isin(inf_tier[inf_idx], ["mid", "macro", "mega"]), 0.25, 0.10)
+is_viral = rng.random(N_POSTS) < 0.05
+eng_rates = inf_engagement[inf_idx] * SEASON_ARR[months]
+likes, comments, shares, saves = gen_engagement_metrics(followers, eng_rates, is_viral)
+reach = (followers * rng.uniform(0.20, 0.40, N_POSTS)).astype(int)
+posts_df = categorize(pd.DataFrame({
+    "post_id": batch_uuids(N_POSTS), "influencer_id": inf_ids[inf_idx],
+    "brand_id": np.where(is_sponsored, brand_ids[post_brand_idx], None),
+    "platform": platforms, "post_date": np.datetime_as_string(post_dates, unit="D"),
+    "post_time_hour": rng.integers(6, 24, N_POSTS),
+    "day_of_week": rng.choice(7, N_POSTS, p=[0.12, 0.16, 0.17, 0.16, 0.14, 0.13, 0.12]),
+    "content_type": content_types,
+    "caption_length": np.clip(rng.normal(180, 80, N_POSTS), 20, 500).astype(int),
+    "hashtag_count": np.clip(rng.normal(np.where(platforms == "Instagram", 8, 4), 3), 1, 30).astype(int),
+    "has_cta": rng.random(N_POSTS) < 0.45,
+    "product_count": np.where(is_sponsored, rng.poisson(2, N_POSTS), 0),
+    "visual_style": sample_dist(VISUALS, N_POSTS), "dominant_color": rng.choice(COLORS, N_POSTS),
+    "is_sponsored": is_sponsored, "discount_code_present": is_sponsored & (rng.random(N_POSTS) < 0.30),
+    "likes": likes, "comments": comments, "shares": shares, "saves": saves,
+    "reach": reach, "impressions": (reach * rng.uniform(1.2, 1.8, N_POSTS)).astype(int)
+}))
+pending_writes.append(writer.submit(write_csv_and_parquet, posts_df, "posts", post_date=post_dates.astype("datetime64[us]")))
 print(f"   ✅ {len(posts_df)} posts")
 
 # Generate Conversions
 print("🛒 Generating Conversions...")
-sponsored_posts = posts_df[posts_df["is_sponsored"] == True].copy()
-brand_lookup = brands_df.set_index("brand_id").to_dict("index")
+sponsored = posts_df["is_sponsored"].to_numpy()
+sp_post_ids = posts_df["post_id"].to_numpy()[sponsored]
+sp_inf_ids = posts_df["influencer_id"].to_numpy()[sponsored]
+sp_brand_idx = post_brand_idx[sponsored]
+sp_post_dates = post_dates[sponsored]
 product_categories = ["Clothing", "Accessories", "Footwear", "Bags", "Jewelry"]
-conversions = []
-for i in range(N_CONVERSIONS):
-    has_attribution = np.random.random() < 0.65
-    if has_attribution and len(sponsored_posts) > 0:
-        post = sponsored_posts.sample(1).iloc[0]
-        post_id, influencer_id, brand_id = post["post_id"], post["influencer_id"], post["brand_id"]
-        post_date = datetime.strptime(post["post_date"], "%Y-%m-%d")
-        journey_length = int(np.clip(np.random.exponential(7), 1, 90))
-        conversion_date = min(post_date + timedelta(days=journey_length), end_date)
-    else:
-        post_id, influencer_id = None, None
-        brand_id = np.random.choice(brand_ids)
-        conversion_date = start_date + timedelta(days=np.random.randint(0, date_range))
-        journey_length = int(np.clip(np.random.exponential(7), 1, 90))
-    brand_tier = brand_lookup[brand_id]["brand_tier"] if brand_id else "Mid-market"
-    conversions.append({
-        "conversion_id": str(uuid4()), "customer_id": str(uuid4()), "post_id": post_id,
-        "influencer_id": influencer_id, "brand_id": brand_id,
-        "conversion_date": conversion_date.strftime("%Y-%m-%d"),
-        "attribution_type": np.random.choice(["first_touch", "last_touch", "linear", "time_decay", "position_based"], p=[0.15, 0.25, 0.20, 0.25, 0.15]),
-        "utm_source": np.random.choice(["instagram", "tiktok", "youtube", "twitter", "direct", "organic"]),
-        "utm_medium": np.random.choice(["social", "influencer", "organic", "paid"]),
-        "order_value": gen_order_value(brand_tier), "product_category": np.random.choice(product_categories),
-        "discount_code_used": post_id is not None and np.random.random() < 0.40,
-        "customer_journey_length": journey_length, "touchpoints_count": int(np.clip(np.random.geometric(0.3), 1, 15))
-    })
-    if (i + 1) % 10000 == 0:
-        print(f"   ... {i+1:,} conversions")
-conversions_df = pd.DataFrame(conversions)
+has_attribution = rng.random(N_CONVERSIONS) < 0.65
+k = rng.integers(0, len(sp_post_ids), N_CONVERSIONS)
+journey_lengths = np.clip(rng.exponential(7, N_CONVERSIONS), 1, 90).astype(int)
+attributed_dates = np.minimum(sp_post_dates[k] + journey_lengths.astype("timedelta64[D]"), end_date)
+random_dates = start_date + rng.integers(0, date_range, N_CONVERSIONS).astype("timedelta64[D]")
+conv_dates = np.where(has_attribution, attributed_dates, random_dates)
+conv_brand_idx = np.where(has_attribution, sp_brand_idx[k], rng.integers(0, N_BRANDS, N_CONVERSIONS))
+conversions_df = categorize(pd.DataFrame({
+    "conversion_id": batch_uuids(N_CONVERSIONS),
+    "customer_id": batch_uuids(N_CONVERSIONS),
+    "post_id": np.where(has_attribution, sp_post_ids[k], None),
+    "influencer_id": np.where(has_attribution, sp_inf_ids[k], None), "brand_id": brand_ids[conv_brand_idx],
+    "conversion_date": np.datetime_as_string(conv_dates, unit="D"),
+    "attribution_type": rng.choice(["first_touch", "last_touch", "linear", "time_decay", "position_based"], N_CONVERSIONS, p=[0.15, 0.25, 0.20, 0.25, 0.15]),
+    "utm_source": rng.choice(["instagram", "tiktok", "youtube", "twitter", "direct", "organic"], N_CONVERSIONS),
+    "utm_medium": rng.choice(["social", "influencer", "organic", "paid"], N_CONVERSIONS),
+    "order_value": gen_order_value(brand_tier_idx[conv_brand_idx]),
+    "product_category": rng.choice(product_categories, N_CONVERSIONS),
+    "discount_code_used": has_attribution & (rng.random(N_CONVERSIONS) < 0.40),
+    "customer_journey_length": journey_lengths,
+    "touchpoints_count": np.clip(rng.geometric(0.3, N_CONVERSIONS), 1, 15)
+}))
+pending_writes.append(writer.submit(write_csv, conversions_df, data_dir / "conversions.csv"))
 print(f"   ✅ {len(conversions_df)} conversions")
 
 # Generate Touchpoints
 print("🔗 Generating Touchpoints...")
-conversions_with_posts = conversions_df[conversions_df["post_id"].notna()].copy()
-touchpoint_types = ["view", "click", "save", "like", "comment", "website_visit", "add_to_cart"]
-post_ids = posts_df["post_id"].tolist()
-touchpoints = []
-for i in range(N_TOUCHPOINTS):
-    leads_to_conversion = np.random.random() < 0.30
-    if leads_to_conversion and len(conversions_with_posts) > 0:
-        conv = conversions_with_posts.sample(1).iloc[0]
-        conversion_id, customer_id, post_id = conv["conversion_id"], conv["customer_id"], conv["post_id"]
-        conv_date = datetime.strptime(conv["conversion_date"], "%Y-%m-%d")
-        touchpoint_date = conv_date - timedelta(days=np.random.randint(0, max(1, conv["customer_journey_length"])))
-    else:
-        conversion_id, customer_id = None, str(uuid4())
-        post_id = np.random.choice(post_ids) if np.random.random() < 0.7 else None
-        touchpoint_date = start_date + timedelta(days=np.random.randint(0, date_range))
-    touchpoints.append({
-        "touchpoint_id": str(uuid4()), "customer_id": customer_id, "post_id": post_id,
-        "touchpoint_type": np.random.choice(touchpoint_types, p=[0.35, 0.20, 0.10, 0.15, 0.05, 0.10, 0.05]),
-        "touchpoint_date": touchpoint_date.strftime("%Y-%m-%d"),
-        "platform": np.random.choice(["Instagram", "TikTok", "YouTube", "Twitter", "Website"]),
-        "contributed_to_conversion": leads_to_conversion, "conversion_id": conversion_id,
-        "attribution_weight": round(np.random.uniform(0.05, 0.40), 3) if leads_to_conversion else 0.0
-    })
-    if (i + 1) % 25000 == 0:
-        print(f"   ... {i+1:,} touchpoints")
-touchpoints_df = pd.DataFrame(touchpoints)
+attributed_conv_idx = np.flatnonzero(has_attribution)
+post_ids = posts_df["post_id"].to_numpy()
+is_lead = rng.random(N_TOUCHPOINTS) < 0.30
+tp_customer_ids = np.array(batch_uuids(N_TOUCHPOINTS), dtype=object)
+tp_post_ids = np.full(N_TOUCHPOINTS, None, dtype=object)
+tp_conversion_ids = np.full(N_TOUCHPOINTS, None, dtype=object)
+tp_dates = start_date + rng.integers(0, date_range, N_TOUCHPOINTS).astype("timedelta64[D]")
+has_post = ~is_lead & (rng.random(N_TOUCHPOINTS) < 0.7)
+tp_post_ids[has_post] = post_ids[rng.integers(0, N_POSTS, np.count_nonzero(has_post))]
+conv_idx = attributed_conv_idx[rng.integers(0, len(attributed_conv_idx), np.count_nonzero(is_lead))]
+tp_conversion_ids[is_lead] = conversions_df["conversion_id"].to_numpy()[conv_idx]
+tp_customer_ids[is_lead] = conversions_df["customer_id"].to_numpy()[conv_idx]
+tp_post_ids[is_lead] = conversions_df["post_id"].to_numpy()[conv_idx]
+tp_dates[is_lead] = conv_dates[conv_idx] - rng.integers(0, np.maximum(1, journey_lengths[conv_idx])).astype("timedelta64[D]")
+touchpoints_df = categorize(pd.DataFrame({
+    "touchpoint_id": batch_uuids(N_TOUCHPOINTS), "customer_id": tp_customer_ids, "post_id": tp_post_ids,
+    "touchpoint_type": sample_dist(TOUCHPOINT_TYPES, N_TOUCHPOINTS),
+    "touchpoint_date": np.datetime_as_string(tp_dates, unit="D"),
+    "platform": rng.choice(["Instagram", "TikTok", "YouTube", "Twitter", "Website"], N_TOUCHPOINTS),
+    "contributed_to_conversion": is_lead, "conversion_id": tp_conversion_ids,
+    "attribution_weight": np.where(is_lead, np.round(rng.uniform(0.05, 0.40, N_TOUCHPOINTS), 3), 0.0)
+}))
 print(f"   ✅ {len(touchpoints_df)} touchpoints")
 
 # Save datasets
 print("\n💾 Saving datasets...")
-brands_df.to_csv(data_dir / "brands.csv", index=False)
-influencers_df.to_csv(data_dir / "influencers.csv", index=False)
-posts_df.to_csv(data_dir / "posts.csv", index=False)
-conversions_df.to_csv(data_dir / "conversions.csv", index=False)
-touchpoints_df.to_csv(data_dir / "touchpoints.csv", index=False)
+pending_writes.append(writer.submit(write_csv, touchpoints_df, data_dir / "touchpoints.csv"))
+for future in pending_writes:
+    future.result()
+writer.shutdown()
 
 # Validation
 print("\n⚖️ BIAS VALIDATION")
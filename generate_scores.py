@@ -1,17 +1,37 @@
 """Generate influencer scores for dashboard"""
 import pandas as pd
 import numpy as np
+import pyarrow.parquet as pq
 from pathlib import Path
-from sklearn.preprocessing import MinMaxScaler
-import warnings
-warnings.filterwarnings('ignore')
 
 print("🌟 Generating Influencer Scores...")
 
+def min_max(values):
+    values = np.nan_to_num(values.to_numpy(dtype=float), nan=0.0)
+    lo, hi = values.min(), values.max()
+    return np.zeros_like(values) if hi == lo else (values - lo) * (100.0 / (hi - lo))
+
 data_dir = Path("data/raw")
-influencers = pd.read_csv(data_dir / "influencers.csv")
-posts = pd.read_csv(data_dir / "posts.csv")
-conversions = pd.read_csv(data_dir / "conversions.csv")
+POST_COUNT_DTYPES = {'likes': 'int32', 'comments': 'int32', 'saves': 'int32', 'shares': 'int32', 'reach': 'int32'}
+
+def read_posts(columns):
+    """Read posts from Parquet when it is at least as new as the CSV, otherwise from the CSV."""
+    csv_path, parquet_path = data_dir / "posts.csv", data_dir / "posts.parquet"
+    if parquet_path.exists() and (
+        not csv_path.exists() or parquet_path.stat().st_mtime >= csv_path.stat().st_mtime
+    ):
+        table = pq.read_table(parquet_path, columns=columns)
+        for col, dtype in POST_COUNT_DTYPES.items():
+            idx = table.schema.get_field_index(col)
+            table = table.set_column(idx, col, table.column(idx).cast(dtype))
+        return table.to_pandas()
+    return pd.read_csv(csv_path, usecols=columns, dtype=POST_COUNT_DTYPES)
+
+influencers = pd.read_csv(data_dir / "influencers.csv", usecols=[
+    'influencer_id', 'username', 'platform', 'tier', 'follower_count', 'engagement_rate',
+    'audience_authenticity_score', 'avg_collaboration_cost', 'content_category'])
+posts = read_posts(['influencer_id', 'post_id', 'likes', 'comments', 'saves', 'shares', 'reach', 'is_sponsored'])
+conversions = pd.read_csv(data_dir / "conversions.csv", usecols=['influencer_id', 'conversion_id', 'order_value'])
 
 # Aggregate post metrics
 inf_post_metrics = posts.groupby('influencer_id').agg({
@@ -32,21 +52,20 @@ inf_data['revenue'] = inf_data['revenue'].fillna(0)
 # Engagement Quality Score (25%)
 inf_data['weighted_engagement'] = inf_data['likes'] + inf_data['comments'] * 2 + inf_data['saves'] * 3 + inf_data['shares'] * 2
 inf_data['engagement_quality'] = inf_data['weighted_engagement'] / (inf_data['follower_count'] / 1000)
-scaler = MinMaxScaler(feature_range=(0, 100))
-inf_data['engagement_quality_score'] = scaler.fit_transform(inf_data[['engagement_quality']].fillna(0))
+inf_data['engagement_quality_score'] = min_max(inf_data['engagement_quality'])
 
 # Authenticity Score (25%)
 inf_data['authenticity_score'] = inf_data['audience_authenticity_score'] * 100
 
 # Conversion Score (30%)
 inf_data['conversion_rate'] = np.where(inf_data['sponsored_posts'] > 0, inf_data['conversions'] / inf_data['sponsored_posts'], 0)
-inf_data['conversion_score'] = scaler.fit_transform(inf_data[['conversion_rate']].fillna(0))
+inf_data['conversion_score'] = min_max(inf_data['conversion_rate'])
 
 # ROI Score (15%)
 inf_data['total_cost'] = inf_data['avg_collaboration_cost'] * inf_data['sponsored_posts'].fillna(0)
 inf_data['roi'] = np.where(inf_data['total_cost'] > 0, (inf_data['revenue'] - inf_data['total_cost']) / inf_data['total_cost'], 0)
 inf_data['roi_capped'] = inf_data['roi'].clip(-1, 10)
-inf_data['roi_score'] = scaler.fit_transform(inf_data[['roi_capped']].fillna(0))
+inf_data['roi_score'] = min_max(inf_data['roi_capped'])
 
 # Brand Alignment Score (5%)
 alignment_scores = {'Luxury Fashion': 95, 'Streetwear': 85, 'Sustainable Fashion': 90, 'Fast Fashion': 80,
@@ -59,8 +78,8 @@ inf_data['influencer_score'] = (0.25 * inf_data['engagement_quality_score'] + 0.
                                  0.05 * inf_data['brand_alignment_score'])
 
 # Segment
-inf_data['performance_segment'] = inf_data['influencer_score'].apply(
-    lambda x: 'High Performer' if x >= 75 else ('Medium Performer' if x >= 50 else 'Low Performer'))
+inf_data['performance_segment'] = pd.cut(inf_data['influencer_score'], bins=[-np.inf, 50, 75, np.inf], right=False,
+                                         labels=['Low Performer', 'Medium Performer', 'High Performer'])
 
 # Save
 output_cols = ['influencer_id', 'username', 'platform', 'tier', 'follower_count', 'engagement_rate',